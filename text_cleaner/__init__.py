@@ -1,6 +1,7 @@
 from text_cleaner.cleaner import (
     TextCleaner,
     clean,
+    clean_batch,
     clean_multiline,
     clean_keep_quotes,
     clean_product_name,
@@ -18,6 +19,7 @@ __version__ = "1.0.0"
 __all__ = [
     "TextCleaner",
     "clean",
+    "clean_batch",
     "clean_multiline",
     "clean_keep_quotes",
     "clean_product_name",
@@ -7,7 +7,82 @@ Handles HTML entities, Unicode artifacts, special characters, and formatting iss
 import re
 import html
 import unicodedata
-from typing import Optional, Set
+from typing import Iterable, List, Optional, Set
+
+
+# ===========================================
+# Accent stripping table
+# ===========================================
+
+# Combining Diacritical Marks blocks (base, extended, supplement,
+# for symbols, half marks)
+_COMBINING_MARK_BLOCKS = (
+    (0x0300, 0x036f),
+    (0x1ab0, 0x1aff),
+    (0x1dc0, 0x1dff),
+    (0x20d0, 0x20ff),
+    (0xfe20, 0xfe2f),
+)
+
+
+def _build_combining_marks_pattern():
+    """Build a character class of the nonspacing marks (Mn) in those blocks."""
+    marks = ''.join(
+        chr(codepoint)
+        for first, last in _COMBINING_MARK_BLOCKS
+        for codepoint in range(first, last + 1)
+        if unicodedata.category(chr(codepoint)) == 'Mn'
+    )
+    return re.compile(f'[{re.escape(marks)}]')
+
+
+_COMBINING_MARKS_PATTERN = _build_combining_marks_pattern()
+
+# Latin-1 Supplement and Latin Extended-A/B cover the accented letters of
+# most scraped Western text
+_ACCENT_TABLE_SIZE = 0x250
+
+# Any character the accent table does not cover
+_BEYOND_ACCENT_TABLE_PATTERN = re.compile(r'[^\x00-\u024f]')
+
+
+def _build_accent_strip_table() -> List[str]:
+    """Build a str.translate table (indexed by codepoint) without accents."""
+    return [
+        _COMBINING_MARKS_PATTERN.sub(
+            '', unicodedata.normalize('NFD', chr(codepoint))
+        )
+        for codepoint in range(_ACCENT_TABLE_SIZE)
+    ]
+
+
+_ACCENT_STRIP_TABLE = _build_accent_strip_table()
+
+
+# ===========================================
+# SKU filter
+# ===========================================
+
+# Everything except word characters, dashes and dots
+_NON_SKU_PATTERN = re.compile(r'[^\w\-.]')
+
+# Same set for ASCII input, as a bytes.translate delete set
+_NON_SKU_ASCII_BYTES = bytes(
+    b for b in range(128) if not (chr(b).isalnum() or chr(b) in '_-.')
+)
+
+
+# ===========================================
+# Price filter
+# ===========================================
+
+# Everything except digits and decimal separators
+_NON_PRICE_PATTERN = re.compile(r'[^\d.,]')
+
+# Same set for ASCII input, as a bytes.translate delete set
+_NON_PRICE_ASCII_BYTES = bytes(
+    b for b in range(128) if chr(b) not in '0123456789.,'
+)
 
 
 class TextCleaner:
@@ -23,6 +98,15 @@ class TextCleaner:
         from text_cleaner import TextCleaner
         cleaner = TextCleaner(preserve_newlines=True)
         text = cleaner.clean(html_content)
+
+        # Custom character sets
+        class MyCleaner(TextCleaner):
+            DASHES = {**TextCleaner.DASHES, '~': '-'}
+
+    The character constants (QUOTES, SPECIAL_SPACES, DASHES, HTML_ENTITIES,
+    INVISIBLE_CHARS) are compiled once per class, when the class is
+    defined. Override them in a subclass; assigning them on an instance or
+    patching them on an existing class afterwards has no effect.
     """
 
     # ===========================================
@@ -172,30 +256,183 @@ class TextCleaner:
         # Precompile patterns
         self._compile_patterns()
 
-    def _compile_patterns(self):
-        """Precompile regex patterns for performance."""
-        # Quote pattern
-        self._quote_pattern = re.compile(f'[{re.escape(self.QUOTES)}]')
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may override the character constants
+        cls._compile_class_patterns()
+
+    @classmethod
+    def _compile_class_patterns(cls):
+        """Precompile the patterns and tables built from class constants."""
+        # Text entities left over after html.unescape (double-escaped input)
+        # and the replacements it was built from
+        cls._html_entity_map = dict(cls.HTML_ENTITIES)
+        cls._html_entity_pattern = None
+        if cls._html_entity_map:
+            cls._html_entity_pattern = re.compile(
+                '|'.join(re.escape(entity) for entity in cls._html_entity_map)
+            )
+
+        # Line-breaking HTML tag patterns
+        cls._br_pattern = re.compile(r'<br\s*/?>', re.IGNORECASE)
+        cls._p_pattern = re.compile(r'</?p\s*/?>', re.IGNORECASE)
+        cls._li_pattern = re.compile(r'<li[^>]*>', re.IGNORECASE)
 
         # HTML tag pattern
-        self._html_tag_pattern = re.compile(r'<[^>]+>')
+        cls._html_tag_pattern = re.compile(r'<[^>]+>')
+
+        # Multiple spaces (a lone space is already normal and not matched)
+        cls._multi_space_pattern = re.compile(r' [ \t]+|\t[ \t]*')
 
-        # Multiple spaces
-        self._multi_space_pattern = re.compile(r'[ \t]+')
+        # Multiple spaces and line breaks (single line output)
+        cls._single_line_space_pattern = re.compile(
+            r' [ \t\r\n]+|[\t\r\n][ \t\r\n]*'
+        )
 
         # Multiple newlines
-        self._multi_newline_pattern = re.compile(r'\n\s*\n+')
+        cls._multi_newline_pattern = re.compile(r'\n\s*\n+')
 
-        # Special spaces pattern
-        self._special_space_pattern = re.compile(
-            '[' + ''.join(re.escape(c) for c in self.SPECIAL_SPACES) + ']'
+        # Invisible chars pattern
+        cls._invisible_pattern = re.compile(
+            '[' + ''.join(re.escape(c) for c in cls.INVISIBLE_CHARS) + ']'
         )
 
-        # Invisible chars pattern
-        self._invisible_pattern = re.compile(
-            '[' + ''.join(re.escape(c) for c in self.INVISIBLE_CHARS) + ']'
+        # Invisible chars and special spaces together (emails)
+        cls._invisible_or_space_pattern = re.compile(
+            '[' + ''.join(
+                re.escape(c) for c in cls.INVISIBLE_CHARS | cls.SPECIAL_SPACES
+            ) + ']'
+        )
+
+        # Tables built from the options, keyed by option values
+        cls._translate_tables_cache = {}
+
+    def _compile_patterns(self):
+        """Precompile regex patterns that depend on the options."""
+        # Extra characters to remove
+        self._extra_remove_pattern = None
+        if self.extra_remove:
+            self._extra_remove_pattern = re.compile(
+                f'[{re.escape(self.extra_remove)}]'
+            )
+
+        # Characters outside the allowed set
+        self._disallowed_pattern = None
+        if self.allowed_chars:
+            self._disallowed_pattern = re.compile(
+                f'[^{self.allowed_chars}]'
+            )
+
+        # Translate tables and dirty-text pattern, shared by all cleaners
+        # with the same character options
+        options = (
+            self.remove_invisible,
+            self.normalize_spaces,
+            self.normalize_dashes,
+            self.remove_quotes,
+            self.decode_html_entities,
+            self.remove_html_tags,
+        )
+        tables = self._translate_tables_cache.get(options)
+        if tables is None:
+            tables = self._translate_tables_cache[options] = (
+                self._build_translate_tables(*options)
+            )
+        (
+            self._translate_table,
+            self._ascii_translate_table,
+            self._ascii_delete_bytes,
+            self._dash_replacements,
+            self._dirty_pattern,
+        ) = tables
+
+    @classmethod
+    def _build_translate_tables(
+            cls,
+            remove_invisible: bool,
+            normalize_spaces: bool,
+            normalize_dashes: bool,
+            remove_quotes: bool,
+            decode_html_entities: bool,
+            remove_html_tags: bool,
+    ):
+        """
+        Build the translate tables and dirty-text pattern for the options.
+
+        Only reads the class constants, so the result can be shared by
+        every instance of the class with the same options.
+        """
+        # Single-pass character translation table (invisible, spaces,
+        # dashes, quotes), built from the enabled options
+        translate_table = {}
+        if remove_invisible:
+            translate_table.update(
+                (ord(c), None) for c in cls.INVISIBLE_CHARS
+            )
+        if normalize_spaces:
+            translate_table.update(
+                (ord(c), ' ') for c in cls.SPECIAL_SPACES
+            )
+        # Multi-character dash sequences can't go in the table; they are
+        # replaced one by one after the translate pass
+        dash_replacements = ()
+        if normalize_dashes:
+            translate_table.update(
+                (ord(dash), replacement)
+                for dash, replacement in cls.DASHES.items()
+                if len(dash) == 1
+            )
+            dash_replacements = tuple(
+                (dash, replacement)
+                for dash, replacement in cls.DASHES.items()
+                if len(dash) != 1
+            )
+        if remove_quotes:
+            # Replace with space to preserve word boundaries
+            translate_table.update(
+                (ord(c), ' ') for c in cls.QUOTES
+            )
+
+        # ASCII part of the translate table, for bytes.translate on ASCII
+        # text; left as None when an ASCII character maps to anything but
+        # nothing or a single ASCII character
+        ascii_table = bytearray(range(256))
+        ascii_delete = bytearray()
+        for codepoint, replacement in translate_table.items():
+            if codepoint >= 128:
+                continue
+            if not replacement:
+                ascii_delete.append(codepoint)
+            elif len(replacement) == 1 and replacement.isascii():
+                ascii_table[codepoint] = ord(replacement)
+            else:
+                ascii_table = None
+                break
+
+        # Any character that entity decoding, tag removal or the translate
+        # table would act on
+        dirty_chars = ''.join(chr(c) for c in translate_table)
+        dirty_chars += ''.join(dash[:1] for dash, _ in dash_replacements)
+        if decode_html_entities:
+            dirty_chars += '&'
+        if remove_html_tags:
+            dirty_chars += '<'
+        dirty_pattern = (
+            re.compile(f'[{re.escape(dirty_chars)}]') if dirty_chars else None
+        )
+
+        return (
+            translate_table,
+            bytes(ascii_table) if ascii_table is not None else None,
+            bytes(ascii_delete),
+            dash_replacements,
+            dirty_pattern,
         )
 
+    def _replace_html_entity(self, match) -> str:
+        """Replacement callback for the text entity pattern."""
+        return self._html_entity_map[match.group(0)]
+
     # ===========================================
     # Main cleaning method
     # ===========================================
@@ -220,47 +457,52 @@ class TextCleaner:
         if not text:
             return ''
 
-        # 1. Decode HTML entities first
-        if self.decode_html_entities:
-            text = html.unescape(text)
-            # Also handle text entity patterns like &nbsp;
-            for entity, replacement in self.HTML_ENTITIES.items():
-                text = text.replace(entity, replacement)
-
-        # 2. Remove HTML tags
-        if self.remove_html_tags:
-            # Convert <br> to newlines before removing tags
-            text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-            text = re.sub(r'</?p\s*/?>', '\n', text, flags=re.IGNORECASE)
-            text = re.sub(r'<li[^>]*>', '\n• ', text, flags=re.IGNORECASE)
-            text = self._html_tag_pattern.sub('', text)
-
-        # 3. Remove invisible characters
-        if self.remove_invisible:
-            text = self._invisible_pattern.sub('', text)
-
-        # 4. Normalize special spaces
-        if self.normalize_spaces:
-            text = self._special_space_pattern.sub(' ', text)
-
-        # 5. Normalize dashes
-        if self.normalize_dashes:
-            for dash, replacement in self.DASHES.items():
+        # Skip decoding, tag removal and translation when the text contains
+        # no character they would act on
+        dirty_pattern = self._dirty_pattern
+        if dirty_pattern is not None and dirty_pattern.search(text):
+            # 1. Decode HTML entities first (every entity starts with '&')
+            if self.decode_html_entities and '&' in text:
+                text = html.unescape(text)
+                # Also handle text entity patterns like &nbsp;
+                # (left over only if '&' itself was escaped)
+                if self._html_entity_pattern is not None and '&' in text:
+                    text = self._html_entity_pattern.sub(
+                        self._replace_html_entity, text
+                    )
+
+            # 2. Remove HTML tags
+            if self.remove_html_tags:
+                # Convert <br> to newlines before removing tags
+                text = self._br_pattern.sub('\n', text)
+                text = self._p_pattern.sub('\n', text)
+                text = self._li_pattern.sub('\n• ', text)
+                text = self._html_tag_pattern.sub('', text)
+
+            # 3. Remove invisible characters, normalize special spaces and
+            # dashes, remove quotes - all in a single translate pass
+            if self._translate_table:
+                if (
+                    self._ascii_translate_table is not None
+                    and text.isascii()
+                ):
+                    text = text.encode('ascii').translate(
+                        self._ascii_translate_table, self._ascii_delete_bytes
+                    ).decode('ascii')
+                else:
+                    text = text.translate(self._translate_table)
+            for dash, replacement in self._dash_replacements:
                 text = text.replace(dash, replacement)
 
-        # 6. Remove quotes (replace with space to preserve word boundaries)
-        if self.remove_quotes:
-            text = self._quote_pattern.sub(' ', text)
-
-        # 7. Remove extra characters
-        if self.extra_remove:
-            text = re.sub(f'[{re.escape(self.extra_remove)}]', '', text)
+        # 4. Remove extra characters
+        if self._extra_remove_pattern is not None:
+            text = self._extra_remove_pattern.sub('', text)
 
-        # 8. Filter to allowed characters only
-        if self.allowed_chars:
-            text = re.sub(f'[^{self.allowed_chars}]', '', text)
+        # 5. Filter to allowed characters only
+        if self._disallowed_pattern is not None:
+            text = self._disallowed_pattern.sub('', text)
 
-        # 9. Handle whitespace (must be after all replacements)
+        # 6. Handle whitespace (must be after all replacements)
         if self.preserve_newlines:
             # Normalize spaces but keep newlines
             text = self._multi_space_pattern.sub(' ', text)
@@ -270,22 +512,50 @@ class TextCleaner:
             text = '\n'.join(lines)
         else:
             # Everything to single line
-            text = text.replace('\n', ' ').replace('\r', ' ')
-            text = self._multi_space_pattern.sub(' ', text)
+            text = self._single_line_space_pattern.sub(' ', text)
 
-        # 10. Lowercase
+        # 7. Lowercase
         if self.lowercase:
             text = text.lower()
 
-        # 11. Strip
+        # 8. Strip
         text = text.strip()
 
-        # 12. Truncate
-        if self.max_length and len(text) > self.max_length:
-            text = text[:self.max_length].rsplit(' ', 1)[0] + '...'
+        # 9. Truncate
+        if self.max_length:
+            text = self.truncate(text, self.max_length)
 
         return text
 
+    def clean_batch(self, texts: Iterable, dedupe: bool = False) -> List[str]:
+        """
+        Clean many texts with the same options.
+
+        Args:
+            texts: Iterable of input texts (str or any type)
+            dedupe: Clean repeated strings only once (useful for columns
+                such as brands or categories). Keeps every distinct string
+                and its result in memory until the batch is done.
+
+        Returns:
+            List of cleaned strings, in input order
+        """
+        clean = self.clean
+        if not dedupe:
+            return [clean(text) for text in texts]
+
+        cleaned = {}
+        results = []
+        for text in texts:
+            if isinstance(text, str):
+                result = cleaned.get(text)
+                if result is None:
+                    result = cleaned[text] = clean(text)
+            else:
+                result = clean(text)
+            results.append(result)
+        return results
+
     # ===========================================
     # Specialized cleaning methods
     # ===========================================
@@ -304,16 +574,17 @@ class TextCleaner:
             return ''
         text = self.clean(text)
         # SKU typically alphanumeric with dashes/underscores
-        text = re.sub(r'[^\w\-.]', '', text)
+        if text.isascii():
+            text = text.encode('ascii').translate(
+                None, _NON_SKU_ASCII_BYTES
+            ).decode('ascii')
+        else:
+            text = _NON_SKU_PATTERN.sub('', text)
         return text.upper()
 
     def clean_description(self, text) -> str:
         """Clean product description - preserves newlines."""
-        cleaner = TextCleaner(
-            remove_quotes=False,
-            preserve_newlines=True,
-        )
-        return cleaner.clean(text)
+        return _description_cleaner.clean(text)
 
     def clean_price_text(self, text) -> str:
         """Extract price string - keeps digits, dots, commas."""
@@ -321,7 +592,12 @@ class TextCleaner:
             return ''
         text = html.unescape(str(text))
         # Keep only digits and decimal separators
-        text = re.sub(r'[^\d.,]', '', text)
+        if text.isascii():
+            text = text.encode('ascii').translate(
+                None, _NON_PRICE_ASCII_BYTES
+            ).decode('ascii')
+        else:
+            text = _NON_PRICE_PATTERN.sub('', text)
         return text.strip()
 
     def clean_url(self, text) -> str:
@@ -338,8 +614,7 @@ class TextCleaner:
         if not text:
             return ''
         text = str(text).strip().lower()
-        text = self._invisible_pattern.sub('', text)
-        text = self._special_space_pattern.sub('', text)
+        text = self._invisible_or_space_pattern.sub('', text)
         return text
 
     # ===========================================
@@ -361,25 +636,45 @@ class TextCleaner:
         return unicodedata.normalize(form, text)
 
     def remove_accents(self, text: str) -> str:
-        """Remove accents from characters (e -> e)."""
+        """
+        Remove accents from characters (e -> e).
+
+        Only nonspacing marks from the Combining Diacritical Marks blocks
+        are removed. Everything else is kept, including:
+            - marks of other scripts (Hebrew points, Arabic harakat,
+              Cyrillic U+0483-U+0487, Indic and Tibetan vowel signs)
+            - kana voicing marks U+3099/U+309A ('ガ' -> 'カ' + U+3099)
+            - variation selectors U+FE00-U+FE0F and U+E0100-U+E01EF
+              (e.g. the emoji selector U+FE0F in '❤️')
+            - enclosing marks such as the keycap U+20E3
+        """
         if not text:
             return ''
+        # Precomputed table when every character is covered by it
+        if _BEYOND_ACCENT_TABLE_PATTERN.search(text) is None:
+            return text.translate(_ACCENT_STRIP_TABLE)
         # Decompose then remove combining marks
         normalized = unicodedata.normalize('NFD', text)
-        return ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+        return _COMBINING_MARKS_PATTERN.sub('', normalized)
 
     def truncate(self, text: str, max_length: int, suffix: str = '...') -> str:
         """Truncate text at word boundary."""
         if not text or len(text) <= max_length:
             return text or ''
-        truncated = text[:max_length].rsplit(' ', 1)[0]
-        return truncated + suffix
+        # Cut at the last space before max_length, or at max_length if none
+        cut = text.rfind(' ', 0, max_length)
+        if cut == -1:
+            cut = max_length
+        return text[:cut] + suffix
 
     def is_empty(self, text) -> bool:
         """Check if text is empty after cleaning."""
         return not bool(self.clean(text))
 
 
+TextCleaner._compile_class_patterns()
+
+
 # ===========================================
 # Module-level functions (simple API)
 # ===========================================
@@ -393,65 +688,27 @@ _multiline_cleaner = TextCleaner(preserve_newlines=True)
 # Cleaner that keeps quotes
 _keep_quotes_cleaner = TextCleaner(remove_quotes=False)
 
-
-def clean(text) -> str:
-    """Clean text with default settings."""
-    return _default_cleaner.clean(text)
-
-
-def clean_multiline(text) -> str:
-    """Clean text preserving newlines."""
-    return _multiline_cleaner.clean(text)
-
-
-def clean_keep_quotes(text) -> str:
-    """Clean text but keep quotes."""
-    return _keep_quotes_cleaner.clean(text)
-
-
-def clean_product_name(text) -> str:
-    """Clean product name."""
-    return _default_cleaner.clean_product_name(text)
-
-
-def clean_brand(text) -> str:
-    """Clean brand/vendor name."""
-    return _default_cleaner.clean_brand(text)
-
-
-def clean_sku(text) -> str:
-    """Clean SKU code."""
-    return _default_cleaner.clean_sku(text)
-
-
-def clean_description(text) -> str:
-    """Clean description with newlines."""
-    return _default_cleaner.clean_description(text)
-
-
-def clean_price_text(text) -> str:
-    """Clean price string."""
-    return _default_cleaner.clean_price_text(text)
-
-
-def clean_url(text) -> str:
-    """Clean URL."""
-    return _default_cleaner.clean_url(text)
-
-
-def clean_email(text) -> str:
-    """Clean email address."""
-    return _default_cleaner.clean_email(text)
-
-
-def normalize_unicode(text: str, form: str = 'NFKC') -> str:
-    """Normalize Unicode."""
-    return _default_cleaner.normalize_unicode(text, form)
-
-
-def remove_accents(text: str) -> str:
-    """Remove accents."""
-    return _default_cleaner.remove_accents(text)
+# Cleaner for descriptions (keeps quotes and newlines)
+_description_cleaner = TextCleaner(
+    remove_quotes=False,
+    preserve_newlines=True,
+)
+
+
+# Bound methods of the shared instances (no extra call per use)
+clean = _default_cleaner.clean
+clean_batch = _default_cleaner.clean_batch
+clean_multiline = _multiline_cleaner.clean
+clean_keep_quotes = _keep_quotes_cleaner.clean
+clean_product_name = _default_cleaner.clean_product_name
+clean_brand = _default_cleaner.clean_brand
+clean_sku = _default_cleaner.clean_sku
+clean_description = _default_cleaner.clean_description
+clean_price_text = _default_cleaner.clean_price_text
+clean_url = _default_cleaner.clean_url
+clean_email = _default_cleaner.clean_email
+normalize_unicode = _default_cleaner.normalize_unicode
+remove_accents = _default_cleaner.remove_accents
 
 
 # ===========================================